@@ -1,145 +1,198 @@
-#same setup as visualizations.py 
+#scores sample facilities with the same criteria as plot 6 in visualizations.py; no plots
 
+import argparse
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import json
 from pathlib import Path
 import numpy as np
 
-# Set style
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 10
-
 # Paths
 DATA_PATH = Path("../data/va_data_centers.json")
-OUTPUT_PATH = Path("../outputs/figures")
-OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
 
-#print("Loading Virginia data centers...")
-with open(DATA_PATH, 'r') as f:
-    data = json.load(f)
+# Parsed frame cache, one per script so their derived columns never mix
+CACHE_PATH = DATA_PATH.with_name(f'{DATA_PATH.stem}.{Path(__file__).stem}.parquet')
+
+parser = argparse.ArgumentParser(description='Score sample Virginia data centers against the exemption criteria')
+parser.add_argument('--verbose', action='store_true',
+                    help='print the full per-category breakdown for each sampled facility')
+args = parser.parse_args()
+
+# Numeric fields arrive as strings with '-' for missing; parse them once so
+# later checks are plain NaN tests
+NUMERIC_COLS = [
+    'nox tpy',
+    'pm2.5 tpy',
+    'co2e tpy',
+    'total population within 1 mile of site',
+    'annual water consumption (gallons)',
+    'daily water consumption (gallons)'
+]
+
+# Low-cardinality text columns the scorer compares against; as categoricals
+# those comparisons run on small integer codes
+WATER_STRESS_LEVELS = [
+    'Low (<10%)',
+    'Low - Medium (10-20%)',
+    'Medium - High (20-40%)',
+    'High (40-80%)',
+    'Extremely High (>80%)',
+    'Unknown'
+]
+EJ_LEVELS = ['no', 'yes']
+EJ_COLS = ['state environmental justice concern', 'us environmental justice concern']
+
+MISSING = frozenset({'-', '', None})
+
+EMISSIONS_FIELDS = ['nox tpy', 'pm2.5 tpy', 'co2e tpy']
+
+# Disclosure: share of the key fields that were actually reported
+DISCLOSURE_FIELDS = [
+    'annual water consumption (gallons)',
+    'daily water consumption (gallons)',
+    'estimate power consumption in kw/hr (calculated 50%)',
+    'total population within 1 mile of site'
+]
+# Number of set bits for every possible disclosure bitmask
+DISCLOSURE_POPCOUNT = np.array([bin(m).count('1') for m in range(1 << len(DISCLOSURE_FIELDS))], dtype=np.uint8)
+
+
+def to_number(values):
+    """Parse numbers that may be formatted as text ('1,234', '-' for missing)"""
+    if not pd.api.types.is_numeric_dtype(values):
+        values = values.map(lambda v: v.replace(',', '').replace(' ', '') if isinstance(v, str) else v)
+    return pd.to_numeric(values, errors='coerce')
+
+
+def to_categorical(values, levels):
+    """Categorical of values; anything outside levels ('-', blanks) becomes missing"""
+    return pd.Categorical(values.where(values.isin(levels)), categories=levels)
+
+
+def is_reported(df, col):
+    """Mask of facilities that disclosed a value for col"""
+    if col in NUMERIC_COLS:
+        return df[col].notna()
+    return ~df[col].isin(MISSING)
+
+
+def load_data():
+    """Read the facility records and derive the columns used for scoring"""
+    # Parse the records straight into columns; keep raw values as-is
+    df = pd.read_json(DATA_PATH, orient='records', dtype=False, convert_dates=False)
 
-# Convert to DataFrame
-df = pd.DataFrame(data)
+    df[NUMERIC_COLS] = df[NUMERIC_COLS].apply(to_number)
 
-# Create commonly used columns early
-df['power_numeric'] = pd.to_numeric(
-    df['estimate power consumption in kw/hr (calculated 50%)'].astype(str).str.replace(',', '').str.replace(' ', ''),
-    errors='coerce'
+    # Create commonly used columns early
+    df['power_numeric'] = to_number(df['estimate power consumption in kw/hr (calculated 50%)'])
+    df['pop_numeric'] = df['total population within 1 mile of site']
+    df['size_category'] = pd.Categorical(df['size category at 50% capacity'].fillna('Unknown'))
+
+    df['water stress'] = to_categorical(df['water stress'], WATER_STRESS_LEVELS)
+    for col in EJ_COLS:
+        df[col] = to_categorical(df[col], EJ_LEVELS)
+
+    # One bit per disclosure field, packed into a single byte per facility
+    disclosure_mask = np.zeros(len(df), dtype=np.uint8)
+    for bit, col in enumerate(DISCLOSURE_FIELDS):
+        disclosure_mask |= is_reported(df, col).to_numpy(np.uint8) << bit
+    df['disclosure_mask'] = disclosure_mask
+    df['disclosure_score'] = DISCLOSURE_POPCOUNT[disclosure_mask] * (100 / len(DISCLOSURE_FIELDS))
+
+    # Shared by the scorer and the per-facility breakdown
+    df['emissions_disclosed'] = sum(df[col].notna().astype(int) for col in EMISSIONS_FIELDS)
+
+    return df
+
+
+#print("Loading Virginia data centers...")
+if not DATA_PATH.exists():
+    parser.exit(1, f"Data file not found: {DATA_PATH.resolve()} (run from the Scripts directory)\n")
+
+# Reuse the parsed frame while it is newer than both the data and this script
+cache_is_fresh = (
+    CACHE_PATH.exists()
+    and CACHE_PATH.stat().st_mtime >= max(DATA_PATH.stat().st_mtime, Path(__file__).stat().st_mtime)
 )
-df['pop_numeric'] = pd.to_numeric(
-    df['total population within 1 mile of site'],
-    errors='coerce'
+if cache_is_fresh:
+    df = pd.read_parquet(CACHE_PATH)
+else:
+    df = load_data()
+    df.to_parquet(CACHE_PATH)
+
+# Calculate SCORES - each criterion is scored for every facility at once
+renewable_pct = 0
+df['renewable_score'] = (renewable_pct / 100) * 15
+
+# Codes index WATER_STRESS_LEVELS: 0-1 low, 2 medium-high, 3-4 high/extreme
+water_codes = df['water stress'].cat.codes.to_numpy()
+df['water_score'] = np.select(
+    [
+        np.isin(water_codes, [0, 1]),
+        (water_codes == 2) & df['annual water consumption (gallons)'].notna().to_numpy(),
+        np.isin(water_codes, [3, 4])
+    ],
+    [8, 5, 0],
+    default=3
 )
-df['size_category'] = df['size category at 50% capacity'].fillna('Unknown')
 
+df['emissions_score'] = df['emissions_disclosed'] * (15 / len(EMISSIONS_FIELDS))
 
-def calculate_disclosure_score(row):
-    score = 0
-    max_score = 4
-    
-    if row['annual water consumption (gallons)'] not in ['-', '', None]:
-        score += 1
-    if row['daily water consumption (gallons)'] not in ['-', '', None]:
-        score += 1
-    if row['estimate power consumption in kw/hr (calculated 50%)'] not in ['-', '', None]:
-        score += 1
-    if row['total population within 1 mile of site'] not in ['-', '', None]:
-        score += 1
-    
-    return (score / max_score) * 100
+pop = df['pop_numeric']
+df['pop_score'] = np.select([pop < 1000, pop < 5000, pop >= 5000], [10, 5, 0], default=3)
+
+# Code 0 is 'no' in EJ_LEVELS
+no_ej_concern = np.logical_and.reduce([df[col].cat.codes.to_numpy() == 0 for col in EJ_COLS])
+df['ej_score'] = np.where(no_ej_concern, 10, 0)
+
+df['engagement_score'] = 5
+
+power = df['power_numeric']
+df['power_score'] = np.select([power < 50000, power < 100000, power >= 100000], [5, 3, 0], default=2)
+
+df['transparency_score'] = (df['disclosure_score'] / 100) * 25
+
+df['exemption_score'] = df[[
+    'renewable_score', 'water_score', 'emissions_score', 'pop_score',
+    'ej_score', 'engagement_score', 'power_score', 'transparency_score'
+]].sum(axis=1)
+df['exemption_tier'] = pd.cut(
+    df['exemption_score'],
+    bins=[-np.inf, 60, 80, np.inf],
+    labels=['No Exemption (0%)', 'Partial Exemption (50%)', 'Full Exemption (100%)'],
+    right=False
+)
 
-df['disclosure_score'] = df.apply(calculate_disclosure_score, axis=1)
 
-def calculate_exemption_eligibility(row):
-    score = 0
-    max_score = 100
+def build_reasons(row):
+    """List the criteria a facility is losing points on"""
     reasons = []
-    
-    renewable_pct = 0
-    score += (renewable_pct / 100) * 15
+
     if renewable_pct < 40:
         reasons.append(f"Low renewable energy ({renewable_pct}%)")
-    
-    water_stress = row['water stress']
-    water_data = row['annual water consumption (gallons)']
-    if water_stress in ['Low (<10%)', 'Low - Medium (10-20%)']:
-        score += 8
-    elif water_stress in ['Medium - High (20-40%)'] and water_data not in ['-', '', None]:
-        score += 5
+
+    if row['water_score'] == 5:
         reasons.append("Medium-high water stress with data")
-    elif water_stress in ['High (40-80%)', 'Extremely High (>80%)']:
-        score += 0
-        reasons.append(f"High water stress ({water_stress})")
-    else:
-        score += 3
-    
-    nox = row['nox tpy']
-    pm25 = row['pm2.5 tpy']
-    co2e = row['co2e tpy']
-    
-    emissions_disclosed = sum([
-        nox not in ['-', '', None],
-        pm25 not in ['-', '', None],
-        co2e not in ['-', '', None]
-    ])
-    score += (emissions_disclosed / 3) * 15
-    
+    elif row['water_score'] == 0:
+        reasons.append(f"High water stress ({row['water stress']})")
+
+    emissions_disclosed = row['emissions_disclosed']
     if emissions_disclosed < 2:
         reasons.append(f"Missing emissions data ({3-emissions_disclosed} fields)")
-    
-    pop = row['total population within 1 mile of site']
-    if pd.notna(pop) and pop != '-':
-        pop_num = float(pop) if isinstance(pop, (int, float)) else 0
-        if pop_num < 1000:
-            score += 10
-        elif pop_num < 5000:
-            score += 5
-            reasons.append(f"Population exposure: {pop_num:.0f} residents")
-        else:
-            score += 0
-            reasons.append(f"High population exposure: {pop_num:.0f} residents")
-    else:
-        score += 3
-    
-    ej_state = row['state environmental justice concern']
-    ej_us = row['us environmental justice concern']
-    if ej_state == 'no' and ej_us == 'no':
-        score += 10
-    else:
-        score += 0
+
+    if row['pop_score'] == 5:
+        reasons.append(f"Population exposure: {row['pop_numeric']:.0f} residents")
+    elif row['pop_score'] == 0:
+        reasons.append(f"High population exposure: {row['pop_numeric']:.0f} residents")
+
+    if row['ej_score'] == 0:
         reasons.append("Environmental justice concerns flagged")
-    
-    score += 5
-    
-    power = row['power_numeric']
-    if pd.notna(power):
-        if power < 50000:
-            score += 5
-        elif power < 100000:
-            score += 3
-        else:
-            score += 0
-            reasons.append(f"High power demand ({power/1000:.0f} MW)")
-    else:
-        score += 2
-    
-    disclosure = row['disclosure_score']
-    score += (disclosure / 100) * 25
-    
-    if disclosure < 50:
-        reasons.append(f"Low disclosure score ({disclosure:.0f}%)")
-    
-    if score >= 80:
-        tier = "Full Exemption (100%)"
-    elif score >= 60:
-        tier = "Partial Exemption (50%)"
-    else:
-        tier = "No Exemption (0%)"
-    
-    return score, tier, reasons
+
+    if row['power_score'] == 0:
+        reasons.append(f"High power demand ({row['power_numeric']/1000:.0f} MW)")
+
+    if row['disclosure_score'] < 50:
+        reasons.append(f"Low disclosure score ({row['disclosure_score']:.0f}%)")
+
+    return reasons
 
 
 def print_detailed_breakdown(row, idx):
@@ -154,123 +207,85 @@ def print_detailed_breakdown(row, idx):
     
     # Initialize score tracking
     score_breakdown = {}
-    total = 0
     
     # 1. RENEWABLE ENERGY (15 pts)
-    renewable_pct = 0
-    renewable_score = (renewable_pct / 100) * 15
-    total += renewable_score
-    score_breakdown['Renewable Energy'] = (renewable_score, 15, f'{renewable_pct}% renewable commitment')
+    score_breakdown['Renewable Energy'] = (row['renewable_score'], 15, f'{renewable_pct}% renewable commitment')
     
     # 2. WATER MANAGEMENT (8 pts)
     water_stress = row['water stress']
-    water_data = row['annual water consumption (gallons)']
+    water_score = row['water_score']
     
-    if water_stress in ['Low (<10%)', 'Low - Medium (10-20%)']:
-        water_score = 8
+    if water_score == 8:
         water_detail = f'Low stress area: {water_stress}'
-    elif water_stress in ['Medium - High (20-40%)'] and water_data not in ['-', '', None]:
-        water_score = 5
+    elif water_score == 5:
         water_detail = f'Med-high stress w/ disclosure: {water_stress}'
-    elif water_stress in ['High (40-80%)', 'Extremely High (>80%)']:
-        water_score = 0
+    elif water_score == 0:
         water_detail = f'High/extreme stress: {water_stress}'
     else:
-        water_score = 3
         water_detail = 'Partial credit'
     
-    total += water_score
     score_breakdown['Water Management'] = (water_score, 8, water_detail)
     
     # 3. EMISSIONS DISCLOSURE (15 pts)
-    nox = row['nox tpy']
-    pm25 = row['pm2.5 tpy']
-    co2e = row['co2e tpy']
-    
-    emissions_disclosed = sum([
-        nox not in ['-', '', None],
-        pm25 not in ['-', '', None],
-        co2e not in ['-', '', None]
-    ])
-    emissions_score = (emissions_disclosed / 3) * 15
-    total += emissions_score
+    disclosed = [
+        label for label, col in [('NOx', 'nox tpy'), ('PM2.5', 'pm2.5 tpy'), ('CO2e', 'co2e tpy')]
+        if pd.notna(row[col])
+    ]
     
-    disclosed = []
-    if nox not in ['-', '', None]: disclosed.append('NOx')
-    if pm25 not in ['-', '', None]: disclosed.append('PM2.5')
-    if co2e not in ['-', '', None]: disclosed.append('CO2e')
-    
-    emissions_detail = f'{emissions_disclosed}/3 disclosed: {", ".join(disclosed) if disclosed else "None"}'
-    score_breakdown['Emissions Disclosure'] = (emissions_score, 15, emissions_detail)
+    emissions_detail = f'{row["emissions_disclosed"]}/3 disclosed: {", ".join(disclosed) if disclosed else "None"}'
+    score_breakdown['Emissions Disclosure'] = (row['emissions_score'], 15, emissions_detail)
     
     # 4. POPULATION EXPOSURE (10 pts)
-    pop = row['total population within 1 mile of site']
-    if pd.notna(pop) and pop != '-':
-        pop_num = float(pop) if isinstance(pop, (int, float)) else 0
-        if pop_num < 1000:
-            pop_score = 10
-            pop_detail = f'{int(pop_num):,} residents (low density)'
-        elif pop_num < 5000:
-            pop_score = 5
-            pop_detail = f'{int(pop_num):,} residents (medium density)'
-        else:
-            pop_score = 0
-            pop_detail = f'{int(pop_num):,} residents (high density)'
+    pop_num = row['pop_numeric']
+    pop_score = row['pop_score']
+    if pop_score == 10:
+        pop_detail = f'{int(pop_num):,} residents (low density)'
+    elif pop_score == 5:
+        pop_detail = f'{int(pop_num):,} residents (medium density)'
+    elif pop_score == 0:
+        pop_detail = f'{int(pop_num):,} residents (high density)'
     else:
-        pop_score = 3
         pop_detail = 'No data (partial credit)'
     
-    total += pop_score
     score_breakdown['Population Exposure'] = (pop_score, 10, pop_detail)
     
     # 5. ENVIRONMENTAL JUSTICE (10 pts)
     ej_state = row['state environmental justice concern']
     ej_us = row['us environmental justice concern']
     
-    if ej_state == 'no' and ej_us == 'no':
-        ej_score = 10
+    if row['ej_score'] == 10:
         ej_detail = 'No EJ concerns'
     else:
-        ej_score = 0
         concerns = []
         if ej_state != 'no': concerns.append('State')
         if ej_us != 'no': concerns.append('Federal')
         ej_detail = f'EJ flags: {", ".join(concerns)}'
     
-    total += ej_score
-    score_breakdown['Environmental Justice'] = (ej_score, 10, ej_detail)
+    score_breakdown['Environmental Justice'] = (row['ej_score'], 10, ej_detail)
     
     # 6. COMMUNITY ENGAGEMENT (5 pts)
-    total += 5
-    score_breakdown['Community Engagement'] = (5, 5, 'Default (stakeholder outreach)')
+    score_breakdown['Community Engagement'] = (row['engagement_score'], 5, 'Default (stakeholder outreach)')
     
     # 7. POWER DEMAND (5 pts)
     power = row['power_numeric']
-    if pd.notna(power):
-        if power < 50000:
-            power_score = 5
-            power_detail = f'{power/1000:.1f} MW (low)'
-        elif power < 100000:
-            power_score = 3
-            power_detail = f'{power/1000:.1f} MW (medium)'
-        else:
-            power_score = 0
-            power_detail = f'{power/1000:.1f} MW (high)'
+    power_score = row['power_score']
+    if power_score == 5:
+        power_detail = f'{power/1000:.1f} MW (low)'
+    elif power_score == 3:
+        power_detail = f'{power/1000:.1f} MW (medium)'
+    elif power_score == 0:
+        power_detail = f'{power/1000:.1f} MW (high)'
     else:
-        power_score = 2
         power_detail = 'No data (partial credit)'
     
-    total += power_score
     score_breakdown['Power Demand'] = (power_score, 5, power_detail)
     
     # 8. DISCLOSURE QUALITY (25 pts)
     disclosure = row['disclosure_score']
-    disclosure_score = (disclosure / 100) * 25
-    total += disclosure_score
-    score_breakdown['Transparency & Disclosure'] = (disclosure_score, 25, f'{disclosure:.0f}% fields complete')
+    score_breakdown['Transparency & Disclosure'] = (row['transparency_score'], 25, f'{disclosure:.0f}% fields complete')
     
     # Print breakdown
-    print(f"\nFINAL SCORE: {total:.1f}/100")
+    print(f"\nFINAL SCORE: {row['exemption_score']:.1f}/100")
     print(f"TIER: {row['exemption_tier']}\n")
     
     
@@ -294,30 +309,47 @@ def print_detailed_breakdown(row, idx):
     print(f"  • Disclosure Quality: {trans_score:.1f}/{trans_max} pts — {trans_detail}")
     
     # Issues
-    if row['failing_criteria']:
+    failing_criteria = build_reasons(row)
+    if failing_criteria:
         print(f"\n KEY ISSUES:")
-        for issue in row['failing_criteria']:
+        for issue in failing_criteria:
             print(f"  • {issue}")
 
 
-# Calculate SCORES
-results = df.apply(calculate_exemption_eligibility, axis=1)
-df['exemption_score'] = results.apply(lambda x: x[0])
-df['exemption_tier'] = results.apply(lambda x: x[1])
-df['failing_criteria'] = results.apply(lambda x: x[2])
 
-# Select 5 diverse examples - mix of high, medium, low scorers
-# Sort by score to pick from different ranges
-df_sorted = df.sort_values('exemption_score')
 
-sample_indices = [
+# Select 5 diverse examples - mix of high, medium, low scorers
+# Partition on score to pick from different ranges without sorting the frame
+n = len(df)
+sample_ranks = [
     0,  # Lowest scorer
-    len(df_sorted) // 4,  # Lower quartile
-    len(df_sorted) // 2,  # Median
-    3 * len(df_sorted) // 4,  # Upper quartile
-    len(df_sorted) - 1  # Highest scorer
+    n // 4,  # Lower quartile
+    n // 2,  # Median
+    3 * n // 4,  # Upper quartile
+    n - 1  # Highest scorer
 ]
+sample_indices = np.argpartition(df['exemption_score'].to_numpy(), sample_ranks)[sample_ranks]
+
+# One table of the sampled facilities, numbered like the detailed breakdowns
+samples = df.iloc[sample_indices]
+summary = pd.DataFrame({
+    'Facility': samples['name'] if 'name' in samples else 'Unknown Facility',
+    'County': samples['county'],
+    'Renewable': samples['renewable_score'],
+    'Water': samples['water_score'],
+    'Emissions': samples['emissions_score'],
+    'Population': samples['pop_score'],
+    'EJ': samples['ej_score'],
+    'Engagement': samples['engagement_score'],
+    'Power': samples['power_score'],
+    'Transparency': samples['transparency_score'],
+    'Score': samples['exemption_score'],
+    'Tier': samples['exemption_tier']
+})
+summary.index = pd.RangeIndex(1, len(summary) + 1)
+print(summary.to_string(float_format='{:.1f}'.format))
 
-for i, idx in enumerate(sample_indices, 1):
-    row = df_sorted.iloc[idx]
-    print_detailed_breakdown(row, i)
+if args.verbose:
+    for i, idx in enumerate(sample_indices, 1):
+        row = df.iloc[idx]
+        print_detailed_breakdown(row, i)
@@ -11,12 +11,18 @@ Creates 4 key plots:
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # headless: figures are only written to PNG, never shown
 import matplotlib.pyplot as plt
+from matplotlib.patches import Patch
 import seaborn as sns
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import numpy as np
 
+plt.ioff()
+
 # Set style
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 8)
@@ -27,34 +33,94 @@ DATA_PATH = Path("../data/va_data_centers.json")
 OUTPUT_PATH = Path("../outputs/figures")
 OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
 
-#print("Loading Virginia data centers...")
-with open(DATA_PATH, 'r') as f:
-    data = json.load(f)
+# Fastest zlib level for the PNG exports; compression dominates save time at 300 dpi
+SAVE_KW = dict(dpi=300, bbox_inches='tight', pil_kwargs={'compress_level': 1})
+
+# (figure, output path) pairs, saved together once every plot is built
+figures = []
+
+# Parsed frame cache, one per script so their derived columns never mix
+CACHE_PATH = DATA_PATH.with_name(f'{DATA_PATH.stem}.{Path(__file__).stem}.parquet')
+
+# Numeric fields arrive as strings with '-', '' or 'redacted' for missing;
+# parse them once so every later check is a plain NaN test
+NUMERIC_COLS = [
+    'nox tpy',
+    'pm tpy',
+    'pm2.5 tpy',
+    'co2e tpy',
+    'annual water consumption (gallons)',
+    'daily water consumption (gallons)',
+    'total population within 1 mile of site'
+]
 
-# Convert to DataFrame
-df = pd.DataFrame(data)
 
-# Create commonly used columns early
-df['power_numeric'] = pd.to_numeric(
-    df['estimate power consumption in kw/hr (calculated 50%)'].astype(str).str.replace(',', '').str.replace(' ', ''),
-    errors='coerce'
-)
-df['pop_numeric'] = pd.to_numeric(
-    df['total population within 1 mile of site'],
-    errors='coerce'
+def to_number(values):
+    """Parse numbers that may be formatted as text ('1,234', '-' for missing)"""
+    if not pd.api.types.is_numeric_dtype(values):
+        values = values.map(lambda v: v.replace(',', '').replace(' ', '') if isinstance(v, str) else v)
+    return pd.to_numeric(values, errors='coerce')
+
+
+def load_data():
+    """Read the facility records and derive the commonly used columns"""
+    with open(DATA_PATH, 'r') as f:
+        data = json.load(f)
+
+    # Convert to DataFrame
+    df = pd.DataFrame(data)
+
+    df[NUMERIC_COLS] = df[NUMERIC_COLS].apply(to_number)
+
+    # Create commonly used columns early
+    df['power_numeric'] = to_number(df['estimate power consumption in kw/hr (calculated 50%)'])
+    df['pop_numeric'] = df['total population within 1 mile of site']
+
+    # kW and resident counts are whole numbers well inside float32's exact range
+    df['power_numeric'] = df['power_numeric'].astype(np.float32)
+    df['pop_numeric'] = df['pop_numeric'].astype(np.float32)
+
+    df['size_category'] = df['size category at 50% capacity'].fillna('Unknown')
+
+    # Few distinct values and repeatedly grouped/counted: keep as integer codes
+    df['county'] = df['county'].astype('category')
+    df['size_category'] = df['size_category'].astype('category')
+
+    return df
+
+
+#print("Loading Virginia data centers...")
+# Reuse the parsed frame while it is newer than both the data and this script
+cache_is_fresh = (
+    CACHE_PATH.exists()
+    and CACHE_PATH.stat().st_mtime >= max(DATA_PATH.stat().st_mtime, Path(__file__).stat().st_mtime)
 )
-df['size_category'] = df['size category at 50% capacity'].fillna('Unknown')
+if cache_is_fresh:
+    df = pd.read_parquet(CACHE_PATH)
+else:
+    df = load_data()
+    df.to_parquet(CACHE_PATH)
 
-# PLOT 1: Geographic Concentration - Facilities by County
-# Count facilities by county
-county_counts = df.groupby('county').size().sort_values(ascending=False)
+N = len(df)
+
+# Facilities per county, largest first; shared by plots 1 and 4 and the summary
+county_counts = df['county'].value_counts()
+
+# Sentinels for undisclosed text fields, used by the plot 5 disclosure mask
+MISSING = frozenset({'-', '', None})
 
+# PLOT 1: Geographic Concentration - Facilities by County
 # Create figure
 fig, ax = plt.subplots(figsize=(14, 8))
 
 # Bar plot
-colors = ["#771e25" if count > 50 else '#457b9d' for count in county_counts.values]
-bars = ax.barh(county_counts.index[:15], county_counts.values[:15], color=colors)
+top_15 = county_counts.head(15)
+top_15_counts = top_15.to_numpy()
+y = np.arange(len(top_15))
+colors = np.where(top_15_counts > 50, "#771e25", '#457b9d')
+bars = ax.barh(y, top_15_counts, color=colors)
+ax.set_yticks(y)
+ax.set_yticklabels(top_15.index.to_numpy())
 
 # Styling
 ax.set_xlabel('Number of Data Centers', fontsize=12, fontweight='bold')
@@ -63,28 +129,24 @@ ax.set_title('Virginia Data Center Concentration by County\nNorthern Virginia Do
              fontsize=14, fontweight='bold', pad=20)
 
 # Add value labels
-for i, (county, count) in enumerate(zip(county_counts.index[:15], county_counts.values[:15])):
-    ax.text(count + 2, i, str(count), va='center', fontsize=10, fontweight='bold')
+ax.bar_label(bars, padding=3, fontsize=10, fontweight='bold')
 
 # Add annotation
 ax.text(0.02, 0.98, 
-        f'Total VA Facilities: {len(df)}\nLoudoun County: {county_counts["Loudoun"]} ({county_counts["Loudoun"]/len(df)*100:.1f}%)',
+        f'Total VA Facilities: {N}\nLoudoun County: {county_counts["Loudoun"]} ({county_counts["Loudoun"]/N*100:.1f}%)',
         transform=ax.transAxes, fontsize=11, verticalalignment='bottom', 
         horizontalalignment='right', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
 plt.tight_layout()
-plt.savefig(OUTPUT_PATH / '1_geographic_concentration.png', dpi=300, bbox_inches='tight')
-plt.close()
+figures.append((fig, OUTPUT_PATH / '1_geographic_concentration.png'))
 
 
 # PLOT 2: Power vs Population - Community Impact
 
-# Filter for valid data
-plot_df = df[
-    (df['power_numeric'].notna()) & 
-    (df['pop_numeric'].notna()) &
-    (df['power_numeric'] > 0)
-].copy()
+# Filter for valid data; NaN power already fails the > 0 test
+has_power = df['power_numeric'].to_numpy() > 0
+has_pop = ~np.isnan(df['pop_numeric'].to_numpy())
+plot_df = df.iloc[has_power & has_pop].copy()
 
 #print(f"Found {len(plot_df)} facilities with both power and population data")
 
@@ -104,7 +166,7 @@ water_stress_colors = {
 }
 
 # Add color based on water stress
-plot_df['color'] = plot_df['water stress'].map(water_stress_colors).fillna('#cccccc')
+plot_df['color'] = [water_stress_colors.get(level, '#cccccc') for level in plot_df['water stress'].to_numpy()]
 
 # Scatter plot
 scatter = ax.scatter(
@@ -130,7 +192,6 @@ ax.set_xscale('log')
 ax.grid(True, alpha=0.3)
 
 # Create custom legend for water stress
-from matplotlib.patches import Patch
 legend_elements = [
     Patch(facecolor='#d62828', label='Extremely High (>80%)'),
     Patch(facecolor='#f77f00', label='High (40-80%)'),
@@ -149,8 +210,7 @@ ax.text(0.02, 0.98,
         bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
 
 plt.tight_layout()
-plt.savefig(OUTPUT_PATH / '2_power_vs_population.png', dpi=300, bbox_inches='tight')
-plt.close()
+figures.append((fig, OUTPUT_PATH / '2_power_vs_population.png'))
 
 # PLOT 3: Missing Data Analysis - The Disclosure Gap
 
@@ -165,15 +225,17 @@ fields_to_check = {
     'Power (Actual)': 'estimate power consumption in kw/hr (calculated 50%)'
 }
 
-# Calculate missing data percentages
+# Calculate missing data percentages - one mask over all checked fields
+checked = df[list(fields_to_check.values())]
+missing_by_field = (checked.isin(['-', '', 'redacted']) | checked.isna()).sum(axis=0)
+
 missing_data = {}
 for label, field in fields_to_check.items():
-    total = len(df)
-    missing = df[field].isin(['-', '', 'redacted']).sum() + df[field].isna().sum()
+    missing = int(missing_by_field[field])
     missing_data[label] = {
         'missing': missing,
-        'present': total - missing,
-        'missing_pct': (missing / total) * 100
+        'present': N - missing,
+        'missing_pct': (missing / N) * 100
     }
 
 # Create stacked bar chart
@@ -193,25 +255,16 @@ bars2 = ax.barh(x, missing_counts, width, left=present_counts, label='Missing/Re
 # Styling
 ax.set_yticks(x)
 ax.set_yticklabels(categories)
-ax.set_xlabel('Number of Facilities (out of 329 total)', fontsize=12, fontweight='bold')
+ax.set_xlabel(f'Number of Facilities (out of {N} total)', fontsize=12, fontweight='bold')
 ax.set_title('The Transparency Gap:\nMissing Data in Virginia Data Center Permits',
              fontsize=14, fontweight='bold', pad=20)
 
-# Add percentage labels
-for i, cat in enumerate(categories):
-    total = len(df)
-    missing_pct = missing_data[cat]['missing_pct']
-    present_pct = 100 - missing_pct
-    
-    # Label for present data
-    if present_counts[i] > 0:
-        ax.text(present_counts[i]/2, i, f'{present_pct:.0f}%', 
-                ha='center', va='center', fontweight='bold', color='white')
-    
-    # Label for missing data
-    if missing_counts[i] > 0:
-        ax.text(present_counts[i] + missing_counts[i]/2, i, f'{missing_pct:.0f}%', 
-                ha='center', va='center', fontweight='bold', color='white')
+# Add percentage labels, centred in each segment; empty segments stay unlabelled
+missing_pcts = [missing_data[cat]['missing_pct'] for cat in categories]
+ax.bar_label(bars1, labels=[f'{100 - pct:.0f}%' if count > 0 else '' for pct, count in zip(missing_pcts, present_counts)],
+             label_type='center', fontweight='bold', color='white')
+ax.bar_label(bars2, labels=[f'{pct:.0f}%' if count > 0 else '' for pct, count in zip(missing_pcts, missing_counts)],
+             label_type='center', fontweight='bold', color='white')
 
 ax.legend(loc='lower right', fontsize=11)
 
@@ -223,8 +276,7 @@ ax.text(0.98, 0.98,
         bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
 
 plt.tight_layout()
-plt.savefig(OUTPUT_PATH / '3_missing_data_analysis.png', dpi=300, bbox_inches='tight')
-plt.close()
+figures.append((fig, OUTPUT_PATH / '3_missing_data_analysis.png'))
 
 # PLOT 4: County Comparison - NoVA vs I-95 Corridor vs Rest
 
@@ -232,9 +284,9 @@ plt.close()
 nova_counties = ['Loudoun', 'Fairfax', 'Prince William', 'Arlington']
 i95_corridor = ['Henrico', 'Mecklenberg', 'Chesterfield']
 
-df['region'] = df['county'].apply(
-    lambda x: 'Northern VA' if x in nova_counties 
-    else ('I-95 Corridor' if x in i95_corridor else 'Rest of VA')
+df['region'] = np.where(
+    df['county'].isin(nova_counties), 'Northern VA',
+    np.where(df['county'].isin(i95_corridor), 'I-95 Corridor', 'Rest of VA')
 )
 
 region_counts = df['region'].value_counts()
@@ -244,7 +296,7 @@ fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
 
 # Pie chart
 colors_pie = ['#e63946', '#457b9d', '#f1faee']
-wedges, texts, autotexts = ax1.pie(
+ax1.pie(
     region_counts.values,
     labels=region_counts.index,
     autopct='%1.1f%%',
@@ -257,57 +309,52 @@ ax1.set_title('Distribution of Virginia Data Centers\nby Region',
               fontsize=14, fontweight='bold', pad=20)
 
 # Bar chart showing top counties
-top_counties = df['county'].value_counts().head(10)
-ax2.barh(range(len(top_counties)), top_counties.values, color='#457b9d')
-ax2.set_yticks(range(len(top_counties)))
-ax2.set_yticklabels(top_counties.index)
+top_counties = county_counts.head(10)
+y = np.arange(len(top_counties))
+county_bars = ax2.barh(y, top_counties.to_numpy(), color='#457b9d')
+ax2.set_yticks(y)
+ax2.set_yticklabels(top_counties.index.to_numpy())
 ax2.set_xlabel('Number of Facilities', fontsize=12, fontweight='bold')
 ax2.set_title('Top 10 Counties by Facility Count',
               fontsize=14, fontweight='bold', pad=20)
 
 # Add value labels
-for i, count in enumerate(top_counties.values):
-    ax2.text(count + 2, i, str(count), va='center', fontweight='bold')
+ax2.bar_label(county_bars, padding=3, fontweight='bold')
 
 # Add summary stats
 summary_text = f"""
 REGIONAL BREAKDOWN:
-Northern VA: {region_counts['Northern VA']} facilities ({region_counts['Northern VA']/len(df)*100:.1f}%)
-I-95 Corridor: {region_counts.get('I-95 Corridor', 0)} facilities ({region_counts.get('I-95 Corridor', 0)/len(df)*100:.1f}%)
-Rest of VA: {region_counts.get('Rest of VA', 0)} facilities ({region_counts.get('Rest of VA', 0)/len(df)*100:.1f}%)
+Northern VA: {region_counts['Northern VA']} facilities ({region_counts['Northern VA']/N*100:.1f}%)
+I-95 Corridor: {region_counts.get('I-95 Corridor', 0)} facilities ({region_counts.get('I-95 Corridor', 0)/N*100:.1f}%)
+Rest of VA: {region_counts.get('Rest of VA', 0)} facilities ({region_counts.get('Rest of VA', 0)/N*100:.1f}%)
 """
 
 fig.text(0.98, 0.98, summary_text, ha='center', fontsize=10,
          bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
 plt.tight_layout()
-plt.savefig(OUTPUT_PATH / '4_regional_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
+figures.append((fig, OUTPUT_PATH / '4_regional_distribution.png'))
 
 
 
 # PLOT 5: Tax Exemption Value vs. Disclosure Quality
-def calculate_disclosure_score(row):
-    score = 0
-    max_score = 4
-    
-    if row['annual water consumption (gallons)'] not in ['-', '', None]:
-        score += 1
-    if row['daily water consumption (gallons)'] not in ['-', '', None]:
-        score += 1
-    if row['estimate power consumption in kw/hr (calculated 50%)'] not in ['-', '', None]:
-        score += 1
-    if row['total population within 1 mile of site'] not in ['-', '', None]:
-        score += 1
-    
-    return (score / max_score) * 100
-
-df['disclosure_score'] = df.apply(calculate_disclosure_score, axis=1)
-
-df['estimated_tax_exemption'] = df['power_numeric'].apply(
-    lambda x: 15_500_000 if pd.notna(x) and x > 100000 else 
-             (9_000_000 if pd.notna(x) and x > 50000 else 5_000_000)
-)
+DISCLOSURE_FIELDS = [
+    'annual water consumption (gallons)',
+    'daily water consumption (gallons)',
+    'estimate power consumption in kw/hr (calculated 50%)',
+    'total population within 1 mile of site'
+]
+disclosure_fields = df[DISCLOSURE_FIELDS]
+present = ~disclosure_fields.isin(MISSING) & disclosure_fields.notna()
+df['disclosure_score'] = present.sum(axis=1).to_numpy() * (100.0 / len(DISCLOSURE_FIELDS))
+
+# NaN power compares False everywhere, so undisclosed facilities get the default
+power = df['power_numeric'].to_numpy()
+df['estimated_tax_exemption'] = np.select(
+    [power > 100000, power > 50000],
+    [15_500_000, 9_000_000],
+    default=5_000_000
+).astype(np.int32)
 
 fig, ax = plt.subplots(figsize=(14, 9))
 
@@ -378,113 +425,70 @@ ax.legend(loc='upper left', fontsize=10, title='Facility Size')
 ax.grid(True, alpha=0.3)
 
 plt.tight_layout()
-plt.savefig(OUTPUT_PATH / '5_tax_exemption_vs_transparency.png', dpi=300, bbox_inches='tight')
-plt.close()
+figures.append((fig, OUTPUT_PATH / '5_tax_exemption_vs_transparency.png'))
 
 # PLOT 6: Tiered Exemption Eligibility Under Proposed Standards
 
-def calculate_exemption_eligibility(row):
-    score = 0
-    max_score = 100
-    reasons = []
-    
-    renewable_pct = 0
-    score += (renewable_pct / 100) * 15
-    if renewable_pct < 40:
-        reasons.append(f"Low renewable energy ({renewable_pct}%)")
-    
-    water_stress = row['water stress']
-    water_data = row['annual water consumption (gallons)']
-    if water_stress in ['Low (<10%)', 'Low - Medium (10-20%)']:
-        score += 8
-    elif water_stress in ['Medium - High (20-40%)'] and water_data not in ['-', '', None]:
-        score += 5
-        reasons.append("Medium-high water stress with data")
-    elif water_stress in ['High (40-80%)', 'Extremely High (>80%)']:
-        score += 0
-        reasons.append(f"High water stress ({water_stress})")
-    else:
-        score += 3
-    
-    nox = row['nox tpy']
-    pm25 = row['pm2.5 tpy']
-    co2e = row['co2e tpy']
-    
-    emissions_disclosed = sum([
-        nox not in ['-', '', None],
-        pm25 not in ['-', '', None],
-        co2e not in ['-', '', None]
-    ])
-    score += (emissions_disclosed / 3) * 15
-    
-    if emissions_disclosed < 2:
-        reasons.append(f"Missing emissions data ({3-emissions_disclosed} fields)")
-    
-    pop = row['total population within 1 mile of site']
-    if pd.notna(pop) and pop != '-':
-        pop_num = float(pop) if isinstance(pop, (int, float)) else 0
-        if pop_num < 1000:
-            score += 10
-        elif pop_num < 5000:
-            score += 5
-            reasons.append(f"Population exposure: {pop_num:.0f} residents")
-        else:
-            score += 0
-            reasons.append(f"High population exposure: {pop_num:.0f} residents")
-    else:
-        score += 3
-    
-    ej_state = row['state environmental justice concern']
-    ej_us = row['us environmental justice concern']
-    if ej_state == 'no' and ej_us == 'no':
-        score += 10
-    else:
-        score += 0
-        reasons.append("Environmental justice concerns flagged")
-    
-    score += 5
-    
-    power = row['power_numeric']
-    if pd.notna(power):
-        if power < 50000:
-            score += 5
-        elif power < 100000:
-            score += 3
-        else:
-            score += 0
-            reasons.append(f"High power demand ({power/1000:.0f} MW)")
-    else:
-        score += 2
-    
-    disclosure = row['disclosure_score']
-    score += (disclosure / 100) * 25
-    
-    if disclosure < 50:
-        reasons.append(f"Low disclosure score ({disclosure:.0f}%)")
-    
-    if score >= 80:
-        tier = "Full Exemption (100%)"
-    elif score >= 60:
-        tier = "Partial Exemption (50%)"
-    else:
-        tier = "No Exemption (0%)"
-    
-    return score, tier, reasons
-
-results = df.apply(calculate_exemption_eligibility, axis=1)
-df['exemption_score'] = results.apply(lambda x: x[0])
-df['exemption_tier'] = results.apply(lambda x: x[1])
-df['failing_criteria'] = results.apply(lambda x: x[2])
+# Score every facility at once; point values match individual_scores.py
+renewable_pct = 0
+renewable_score = (renewable_pct / 100) * 15
+
+LOW_STRESS = ['Low (<10%)', 'Low - Medium (10-20%)']
+MED_STRESS = ['Medium - High (20-40%)']
+HIGH_STRESS = ['High (40-80%)', 'Extremely High (>80%)']
+
+water_stress = df['water stress'].to_numpy()
+water_reported = df['annual water consumption (gallons)'].notna().to_numpy()
+water_score = np.select(
+    [
+        np.isin(water_stress, LOW_STRESS),
+        np.isin(water_stress, MED_STRESS) & water_reported,
+        np.isin(water_stress, HIGH_STRESS)
+    ],
+    [8, 5, 0],
+    default=3
+)
+
+emissions_disclosed = df[['nox tpy', 'pm2.5 tpy', 'co2e tpy']].notna().sum(axis=1).to_numpy()
+emissions_score = emissions_disclosed * (15 / 3)
+
+pop = df['pop_numeric'].to_numpy()
+pop_score = np.select([pop < 1000, pop < 5000, pop >= 5000], [10, 5, 0], default=3)
+
+no_ej_concern = (
+    (df['state environmental justice concern'].to_numpy() == 'no')
+    & (df['us environmental justice concern'].to_numpy() == 'no')
+)
+ej_score = np.where(no_ej_concern, 10, 0)
+
+engagement_score = 5
+
+power = df['power_numeric'].to_numpy()
+power_score = np.select([power < 50000, power < 100000, power >= 100000], [5, 3, 0], default=2)
+
+transparency_score = (df['disclosure_score'].to_numpy() / 100) * 25
+
+df['exemption_score'] = (
+    renewable_score + water_score + emissions_score + pop_score
+    + ej_score + engagement_score + power_score + transparency_score
+)
+df['exemption_tier'] = pd.cut(
+    df['exemption_score'],
+    bins=[-np.inf, 60, 80, np.inf],
+    labels=['No Exemption (0%)', 'Partial Exemption (50%)', 'Full Exemption (100%)'],
+    right=False
+)
 
 tier_counts = df['exemption_tier'].value_counts()
+tier_counts = tier_counts[tier_counts > 0]  # pd.cut keeps empty tiers; no zero wedges
 
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
 
 colors_tier = ['#e63946', '#f77f00', '#06d6a0']
-# Dynamic explode based on actual number of tiers
-explode = tuple([0.1 if i == 0 else 0.05 if i == 1 else 0 for i in range(len(tier_counts))])
+# Explode the two largest wedges; trim to however many tiers are present
+explode = (0.1, 0.05, 0)[:len(tier_counts)]
 
-wedges, texts, autotexts = ax1.pie(
+ax1.pie(
     tier_counts.values,
     labels=[f"{label}\n({count} facilities)" for label, count in zip(tier_counts.index, tier_counts.values)],
     autopct='%1.1f%%',
@@ -512,14 +516,24 @@ ax2.legend(fontsize=10)
 ax2.grid(True, alpha=0.3)
 
 plt.tight_layout()
-plt.savefig(OUTPUT_PATH / '6_tiered_exemption_eligibility.png', dpi=300, bbox_inches='tight')
-plt.close()
+figures.append((fig, OUTPUT_PATH / '6_tiered_exemption_eligibility.png'))
+
+# Save all figures in parallel; PNG encoding releases the GIL
+def save_figure(fig_and_path):
+    fig, path = fig_and_path
+    fig.savefig(path, **SAVE_KW)
+
+with ThreadPoolExecutor(max_workers=len(figures)) as executor:
+    list(executor.map(save_figure, figures))
+
+for fig, _ in figures:
+    plt.close(fig)
 
 print("SUMMARY STATISTICS")
-print(f"\nTotal VA Facilities: {len(df)}")
+print(f"\nTotal VA Facilities: {N}")
 print(f"\nTop 3 Counties:")
 for county, count in county_counts.head(3).items():
-    print(f"  {county}: {count} ({count/len(df)*100:.1f}%)")
+    print(f"  {county}: {count} ({count/N*100:.1f}%)")
 
 print(f"\nFacilities with Population Data: {len(df[df['pop_numeric'].notna()])}")
 print(f"Facilities with Power Data: {len(df[df['power_numeric'].notna()])}")
@@ -527,8 +541,8 @@ print(f"Facilities with Power Data: {len(df[df['power_numeric'].notna()])}")
 print(f"\nWater Data Completeness:")
 water_fields = ['annual water consumption (gallons)', 'daily water consumption (gallons)']
 for field in water_fields:
-    missing = df[field].isin(['-', '']).sum() + df[field].isna().sum()
-    print(f"  {field}: {(1 - missing/len(df))*100:.1f}% complete")
+    missing = df[field].isna().sum()
+    print(f"  {field}: {(1 - missing/N)*100:.1f}% complete")
 
 print(f"\nTRANSPARENCY & ACCOUNTABILITY:")
 print(f"  Median disclosure score: {df['disclosure_score'].median():.1f}%")
@@ -537,7 +551,7 @@ print(f"  Total estimated tax exemptions: ${df['estimated_tax_exemption'].sum()/
 print(f"\nTIERED EXEMPTION ELIGIBILITY:")
 for tier in ['Full Exemption (100%)', 'Partial Exemption (50%)', 'No Exemption (0%)']:
     count = (df['exemption_tier'] == tier).sum()
-    print(f"  {tier}: {count} facilities ({count/len(df)*100:.1f}%)")
+    print(f"  {tier}: {count} facilities ({count/N*100:.1f}%)")
 
 print(f"\nMean exemption score: {df['exemption_score'].mean():.1f}")
 print(f"Median exemption score: {df['exemption_score'].median():.1f}")
\ No newline at end of file